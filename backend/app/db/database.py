@@ -24,6 +24,7 @@ from contextlib import asynccontextmanager
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, AsyncEngine
 from sqlalchemy.orm import sessionmaker, declarative_base
 from sqlalchemy import MetaData, text
+from sqlalchemy.engine import make_url
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -87,7 +88,7 @@ def get_database_url() -> str:
     return database_url
 
 
-def get_engine() -> AsyncEngine:
+def get_engine(database_url: Optional[str] = None, null_pool: bool = False) -> AsyncEngine:
     """
     Get or create the async SQLAlchemy engine.
     
@@ -95,9 +96,20 @@ def get_engine() -> AsyncEngine:
     The engine is created only when first accessed, which improves
     application startup time and allows for proper configuration.
     
+    Args:
+        database_url: Explicit database URL to use instead of the environment
+            configuration. Only applies when the engine is first created.
+        null_pool: Open a fresh connection per checkout instead of keeping a
+            pool, for short-lived processes such as the test suite. Ignored
+            for SQLite. Only applies when the engine is first created.
+    
     Returns:
         AsyncEngine: Configured SQLAlchemy async engine
         
+    Raises:
+        RuntimeError: If the engine already exists with a different URL or
+            pool than requested. Call close_db() first to reconfigure it.
+        
     Note:
         The engine is configured with echo=True for development.
         Set echo=False in production for better performance.
@@ -105,7 +117,7 @@ def get_engine() -> AsyncEngine:
     global _engine
     
     if _engine is None:
-        database_url = get_database_url()
+        database_url = database_url or get_database_url()
         
         # Create async engine with optimized settings
         engine_kwargs = {
@@ -119,6 +131,9 @@ def get_engine() -> AsyncEngine:
                 "connect_args": {"check_same_thread": False},
                 "poolclass": StaticPool,
             })
+        elif null_pool:
+            from sqlalchemy.pool import NullPool
+            engine_kwargs["poolclass"] = NullPool
         else:
             engine_kwargs.update({
                 "pool_size": 10,
@@ -129,6 +144,22 @@ def get_engine() -> AsyncEngine:
         _engine = create_async_engine(database_url, **engine_kwargs)
         
         logger.info("✅ Database engine created successfully")
+    else:
+        from sqlalchemy.pool import NullPool
+        if database_url and make_url(database_url) != _engine.url:
+            raise RuntimeError(
+                "Database engine already created for a different URL; "
+                "call close_db() before requesting another one"
+            )
+        if (
+            null_pool
+            and _engine.dialect.name != "sqlite"
+            and not isinstance(_engine.pool, NullPool)
+        ):
+            raise RuntimeError(
+                "Database engine already created with a connection pool; "
+                "call close_db() before requesting null_pool=True"
+            )
     
     return _engine
 
@@ -224,7 +255,7 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
-async def init_db() -> None:
+async def init_db(database_url: Optional[str] = None) -> None:
     """
     Initialize database tables.
     
@@ -232,12 +263,17 @@ async def init_db() -> None:
     models. It should be called during application startup to ensure
     the database schema is up to date.
     
+    Args:
+        database_url: Optional database URL passed through to get_engine(),
+            e.g. to point tests at an in-memory database. Raises
+            RuntimeError if the engine already exists for another URL.
+    
     Note:
         In production, use Alembic migrations instead of this function
         for better version control and rollback capabilities.
     """
     try:
-        engine = get_engine()
+        engine = get_engine(database_url)
         
         async with engine.begin() as conn:
             # Create all tables defined in Base.metadata
@@ -15,6 +15,7 @@ Version: 1.0.0
 import asyncio
 import sys
 import os
+import uuid
 from datetime import datetime
 from typing import List, Dict, Any
 
@@ -90,10 +91,10 @@ class FinalDemo:
             self.session.add(role)
             created_roles.append(role)
         
-        await self.session.commit()
+        # Flush to get ids; the demo commits once, after the permission updates
+        await self.session.flush()
         
         for role in created_roles:
-            await self.session.refresh(role)
             print(f"  ✅ Created role: {role.name} (ID: {role.id})")
             print(f"     Permissions: {role.get_permissions_list()}")
         
@@ -121,7 +122,6 @@ class FinalDemo:
         # Update permissions
         admin_role.set_permissions_list(["user:read", "user:write", "role:manage", "audit:read"])
         await self.session.commit()
-        await self.session.refresh(admin_role)
         print(f"  ✏️  Updated permissions: {admin_role.get_permissions_list()}")
         
         return created_roles
@@ -156,11 +156,15 @@ class FinalDemo:
             }
         ]
         
+        # Hash the shared demo password once rather than once per user
+        password_hash = get_password_hash("DemoPassword123!")
+        
         created_users = []
         for data in users_data:
             user = User(
+                id=uuid.uuid4(),
                 email=data["email"],
-                hashed_password=get_password_hash("DemoPassword123!"),
+                hashed_password=password_hash,
                 first_name=data["first_name"],
                 last_name=data["last_name"],
                 is_superuser=data["is_superuser"],
@@ -171,10 +175,10 @@ class FinalDemo:
             self.session.add(user)
             created_users.append(user)
         
-        await self.session.commit()
+        # Flush to get ids; the demo commits once, after the profile update
+        await self.session.flush()
         
         for user in created_users:
-            await self.session.refresh(user)
             print(f"  ✅ Created user: {user.email} (ID: {user.id})")
             print(f"     Full name: {user.full_name}")
             print(f"     Is superuser: {user.is_superuser}")
@@ -193,7 +197,6 @@ class FinalDemo:
         demo_user.phone = "+1234567890"
         demo_user.bio = "Demo user for testing purposes"
         await self.session.commit()
-        await self.session.refresh(demo_user)
         
         print(f"  📞 Phone: {demo_user.phone}")
         print(f"  📝 Bio: {demo_user.bio}")
@@ -215,22 +218,21 @@ class FinalDemo:
             (users[2], roles[2]),  # user@demo.com -> demo_user
         ]
         
-        created_assignments = []
-        for user, role in assignments:
-            assignment = UserRole(
-                user_id=user.id,
-                role_id=role.id,
+        # Link through the relationships so assignment.user/.role are set in
+        # memory and can be printed without refreshing after the commit
+        created_assignments = [
+            UserRole(
+                user=user,
+                role=role,
                 assigned_by=user.id,  # Self-assigned for demo
                 is_active=True
             )
-            
-            self.session.add(assignment)
-            created_assignments.append(assignment)
-        
+            for user, role in assignments
+        ]
+        self.session.add_all(created_assignments)
         await self.session.commit()
         
         for assignment in created_assignments:
-            await self.session.refresh(assignment)
             print(f"  ✅ Assigned {assignment.user.email} -> {assignment.role.name}")
         
         # Demonstrate user role methods
@@ -290,7 +292,7 @@ class FinalDemo:
             )
             .outerjoin(UserRole, Role.id == UserRole.role_id)
             .where(UserRole.is_active == True)
-            .group_by(Role.id, Role.name, Role.description, Role.is_active)
+            .group_by(Role.id)
             .order_by(func.count(UserRole.id).desc())
         )
         
@@ -406,7 +408,6 @@ class FinalDemo:
             role.set_permissions_list(["valid:permission", "", "another:valid"])
             self.session.add(role)
             await self.session.commit()
-            await self.session.refresh(role)
             
             permissions = role.get_permissions_list()
             print(f"  ✅ Permission validation handled gracefully")
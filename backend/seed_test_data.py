@@ -15,6 +15,7 @@ Version: 1.0.0
 import asyncio
 import sys
 import os
+import uuid
 from datetime import datetime
 from typing import List, Dict, Any
 
@@ -165,13 +166,16 @@ class DatabaseSeeder:
             }
         ]
         
+        # Look up every existing role in one query instead of one per role
+        result = await self.session.execute(
+            select(Role).where(Role.name.in_([data["name"] for data in role_data]))
+        )
+        existing_roles = {role.name: role for role in result.scalars()}
+        
         roles = []
+        new_roles = []
         for data in role_data:
-            # Check if role already exists
-            result = await self.session.execute(
-                select(Role).where(Role.name == data["name"])
-            )
-            existing_role = result.scalar_one_or_none()
+            existing_role = existing_roles.get(data["name"])
             
             if existing_role:
                 print(f"   ⚠️  Role '{data['name']}' already exists, skipping...")
@@ -185,15 +189,14 @@ class DatabaseSeeder:
             )
             role.set_permissions_list(data["permissions"])
             
-            self.session.add(role)
+            new_roles.append(role)
             roles.append(role)
         
+        # One flush inserts every new role; ids and server defaults come back
+        # with the INSERT, so no per-row refresh is needed
+        self.session.add_all(new_roles)
         await self.session.commit()
         
-        # Refresh roles to get their IDs
-        for role in roles:
-            await self.session.refresh(role)
-        
         self.seeded_roles = roles
         print(f"✅ Seeded {len(roles)} roles")
         return roles
@@ -321,13 +324,16 @@ class DatabaseSeeder:
             }
         ]
         
+        # Look up every existing user in one query instead of one per user
+        result = await self.session.execute(
+            select(User).where(User.email.in_([data["email"] for data in user_data]))
+        )
+        existing_users = {user.email: user for user in result.scalars()}
+        
         users = []
+        new_users = []
         for data in user_data:
-            # Check if user already exists
-            result = await self.session.execute(
-                select(User).where(User.email == data["email"])
-            )
-            existing_user = result.scalar_one_or_none()
+            existing_user = existing_users.get(data["email"])
             
             if existing_user:
                 print(f"   ⚠️  User '{data['email']}' already exists, skipping...")
@@ -335,6 +341,7 @@ class DatabaseSeeder:
                 continue
             
             user = User(
+                id=uuid.uuid4(),
                 email=data["email"],
                 hashed_password=get_password_hash(data["password"]),
                 first_name=data["first_name"],
@@ -346,15 +353,12 @@ class DatabaseSeeder:
                 phone=data.get("phone")
             )
             
-            self.session.add(user)
+            new_users.append(user)
             users.append(user)
         
+        self.session.add_all(new_users)
         await self.session.commit()
         
-        # Refresh users to get their IDs
-        for user in users:
-            await self.session.refresh(user)
-        
         self.seeded_users = users
         print(f"✅ Seeded {len(users)} users")
         return users
@@ -401,7 +405,20 @@ class DatabaseSeeder:
             ("jane.smith@test.com", "analyst"),  # User with multiple roles
         ]
         
+        # Find an admin user to assign roles
+        admin_user = user_map.get("admin@test.com") or user_map.get("superadmin@test.com")
+        
+        # Existing assignments for these users, keyed by (user_id, role_id)
+        result = await self.session.execute(
+            select(UserRole).where(UserRole.user_id.in_([user.id for user in users]))
+        )
+        existing_assignments = {
+            (assignment.user_id, assignment.role_id): assignment
+            for assignment in result.scalars()
+        }
+        
         assignment_objects = []
+        new_assignments = []
         for email, role_name in assignments:
             user = user_map.get(email)
             role = role_map.get(role_name)
@@ -410,22 +427,13 @@ class DatabaseSeeder:
                 print(f"   ⚠️  Skipping assignment: {email} -> {role_name} (user or role not found)")
                 continue
             
-            # Check if assignment already exists
-            result = await self.session.execute(
-                select(UserRole).where(
-                    UserRole.user_id == user.id,
-                    UserRole.role_id == role.id
-                )
-            )
-            existing_assignment = result.scalar_one_or_none()
+            existing_assignment = existing_assignments.get((user.id, role.id))
             
             if existing_assignment:
                 print(f"   ⚠️  Assignment {email} -> {role_name} already exists, skipping...")
                 assignment_objects.append(existing_assignment)
                 continue
             
-            # Find an admin user to assign roles
-            admin_user = user_map.get("admin@test.com") or user_map.get("superadmin@test.com")
             assigned_by = admin_user.id if admin_user else user.id
             
             assignment = UserRole(
@@ -434,16 +442,13 @@ class DatabaseSeeder:
                 assigned_by=assigned_by,
                 is_active=True
             )
-            
-            self.session.add(assignment)
+            new_assignments.append(assignment)
             assignment_objects.append(assignment)
         
+        # The flush at commit assigns ids; expire_on_commit=False keeps them
+        self.session.add_all(new_assignments)
         await self.session.commit()
         
-        # Refresh assignments to get their IDs
-        for assignment in assignment_objects:
-            await self.session.refresh(assignment)
-        
         self.seeded_assignments = assignment_objects
         print(f"✅ Seeded {len(assignment_objects)} role assignments")
         return assignment_objects
@@ -464,12 +469,16 @@ class DatabaseSeeder:
         
         print(f"\n🔗 Role assignments created: {len(self.seeded_assignments)}")
         
-        # Group assignments by user
+        # Group assignments by user. Resolve ids against the users and roles
+        # already in memory rather than lazy-loading assignment.user/.role,
+        # which would cost a query per assignment (and fails under asyncio)
+        users_by_id = {user.id: user for user in self.seeded_users}
+        roles_by_id = {role.id: role for role in self.seeded_roles}
         user_assignments = {}
         for assignment in self.seeded_assignments:
-            if assignment.user.email not in user_assignments:
-                user_assignments[assignment.user.email] = []
-            user_assignments[assignment.user.email].append(assignment.role.name)
+            email = users_by_id[assignment.user_id].email
+            role_name = roles_by_id[assignment.role_id].name
+            user_assignments.setdefault(email, []).append(role_name)
         
         for email, role_names in user_assignments.items():
             print(f"   - {email}: {', '.join(role_names)}")
@@ -15,14 +15,14 @@ Version: 1.0.0
 import asyncio
 import sys
 import os
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 # Add the app directory to the Python path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'app'))
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import selectinload, sessionmaker
 
 from app.db.database import get_async_session_local, init_db
 from app.models.user import User
@@ -33,34 +33,32 @@ class SimpleRoleTester:
     """Simple tester for Role and User model system using existing data."""
     
     def __init__(self):
-        self.session: AsyncSession = None
+        self.session_factory: Optional[sessionmaker] = None
     
     async def setup(self):
-        """Initialize database and create test session."""
+        """Initialize database and get the shared session factory."""
         print("🔧 Setting up test environment...")
         
         # Initialize database
         await init_db()
         
-        # Create session
-        async_session = get_async_session_local()
-        self.session = async_session()
+        # Sessions come from the app's factory so they check connections out
+        # of the engine's pool instead of holding one open for the whole run
+        self.session_factory = get_async_session_local()
         
         print("✅ Test environment ready")
     
     async def cleanup(self):
-        """Clean up and close session."""
-        if self.session:
-            await self.session.close()
+        """Clean up test environment."""
         print("✅ Test cleanup completed")
     
-    async def test_existing_data(self):
+    async def test_existing_data(self, session: AsyncSession):
         """Test with existing data in the database."""
         print("\n🧪 Testing with existing data...")
         
         # Test 1: Get all roles
         print("  📊 Testing role retrieval...")
-        result = await self.session.execute(select(Role))
+        result = await session.execute(select(Role))
         roles = result.scalars().all()
         print(f"    ✅ Found {len(roles)} roles:")
         for role in roles:
@@ -69,7 +67,7 @@ class SimpleRoleTester:
         
         # Test 2: Get all users
         print("\n  👥 Testing user retrieval...")
-        result = await self.session.execute(select(User))
+        result = await session.execute(select(User))
         users = result.scalars().all()
         print(f"    ✅ Found {len(users)} users:")
         for user in users:
@@ -77,7 +75,7 @@ class SimpleRoleTester:
         
         # Test 3: Get users with their roles
         print("\n  🔗 Testing user-role relationships...")
-        result = await self.session.execute(
+        result = await session.execute(
             select(User)
             .options(selectinload(User.roles).selectinload(UserRole.role))
             .limit(5)  # Limit to first 5 users for demo
@@ -95,7 +93,7 @@ class SimpleRoleTester:
         
         # Test 4: Role statistics
         print("\n  📈 Testing role statistics...")
-        result = await self.session.execute(
+        result = await session.execute(
             select(
                 Role.name,
                 Role.description,
@@ -104,7 +102,7 @@ class SimpleRoleTester:
             )
             .outerjoin(UserRole, Role.id == UserRole.role_id)
             .where(UserRole.is_active == True)
-            .group_by(Role.id, Role.name, Role.description, Role.is_active)
+            .group_by(Role.id)
             .order_by(func.count(UserRole.id).desc())
         )
         
@@ -129,14 +127,12 @@ class SimpleRoleTester:
             
             # Test adding a permission
             test_role.add_permission("test:permission")
-            await self.session.commit()
-            await self.session.refresh(test_role)
+            await session.commit()
             print(f"    After adding 'test:permission': {test_role.get_permissions_list()}")
             
             # Test removing the permission
             test_role.remove_permission("test:permission")
-            await self.session.commit()
-            await self.session.refresh(test_role)
+            await session.commit()
             print(f"    After removing 'test:permission': {test_role.get_permissions_list()}")
         
         # Test 6: Serialization
@@ -167,7 +163,8 @@ class SimpleRoleTester:
         
         try:
             await self.setup()
-            await self.test_existing_data()
+            async with self.session_factory() as session:
+                await self.test_existing_data(session)
             
             print("\n" + "=" * 50)
             print("🎉 All tests passed successfully!")
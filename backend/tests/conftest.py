@@ -7,62 +7,265 @@ used across all test modules.
 import asyncio
 import os
 import sys
+from contextlib import asynccontextmanager, contextmanager
 from pathlib import Path
+from typing import Any, Dict, List, Tuple
 
 # Add the backend directory to Python path
 backend_dir = Path(__file__).parent.parent
 sys.path.insert(0, str(backend_dir))
 
+# Shared-cache in-memory SQLite: every connection in the process sees the same
+# database, so the schema is created once. Set TEST_DATABASE_URL to test elsewhere.
+TEST_DATABASE_URL = os.getenv(
+    "TEST_DATABASE_URL",
+    "sqlite+aiosqlite:///file::memory:?cache=shared&uri=true"
+)
+
+# The engine echoes SQL unless told otherwise; logging every statement is
+# the biggest per-query overhead in the suite. Export SQL_ECHO=true to debug.
+os.environ.setdefault("SQL_ECHO", "false")
+
 # Import common test utilities
-from app.db.database import get_async_session_local, init_db
+from app.db.database import close_db, get_async_session_local, get_engine, init_db
 from app.models import User, Role, UserRole, Resume, Score
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import delete
+from sqlalchemy import delete, event, insert
+from sqlalchemy.orm import configure_mappers, raiseload
+from sqlalchemy.orm.attributes import set_committed_value
 import uuid
 import pytest
 
 
+def pytest_addoption(parser):
+    """Register custom command line options."""
+    parser.addoption(
+        "--run-slow",
+        action="store_true",
+        default=False,
+        help="run tests marked as slow"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip tests marked as slow unless --run-slow is given."""
+    if config.getoption("--run-slow"):
+        return
+    skip_slow = pytest.mark.skip(reason="need --run-slow option to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
 async def clear_test_data():
-    """Clear all test data from the database."""
+    """Clear all test data from the database in a single transaction."""
     async with get_async_session_local()() as db:
-        # Delete in reverse order of dependencies
-        await db.execute(delete(Score))
-        await db.execute(delete(Resume))
-        await db.execute(delete(UserRole))
-        await db.execute(delete(Role))
-        await db.execute(delete(User))
-        await db.commit()
+        async with db.begin():
+            # Delete in reverse order of dependencies
+            await db.execute(delete(Score))
+            await db.execute(delete(Resume))
+            await db.execute(delete(UserRole))
+            await db.execute(delete(Role))
+            await db.execute(delete(User))
 
 
-@pytest.fixture
-async def db():
-    """Database session fixture for tests."""
-    async with get_async_session_local()() as session:
+def _raise_on_lazy_sql(orm_execute_state):
+    """
+    Make relationships that a query didn't eager-load raise instead of lazy-loading.
+    
+    Under asyncio an implicit lazy load fails with an opaque MissingGreenlet;
+    this turns it into an error naming the attribute, so the fix (a
+    ``selectinload``/``joinedload`` on the query) is obvious. Loads that need
+    no SQL, such as many-to-one lookups satisfied by the identity map, and
+    the loader's own relationship/refresh queries are left alone. Queries
+    that already set loader options keep them as written, since a later
+    wildcard would override an explicit ``raiseload("*")``.
+    """
+    statement = orm_execute_state.statement
+    if (
+        orm_execute_state.is_select
+        and not orm_execute_state.is_column_load
+        and not orm_execute_state.is_relationship_load
+        and not statement._with_options
+    ):
+        orm_execute_state.statement = statement.options(raiseload("*", sql_only=True))
+
+
+@asynccontextmanager
+async def transactional_session(engine):
+    """
+    Open a session inside an outer transaction that is rolled back on exit.
+    
+    The session joins the transaction with SAVEPOINTs, so a test's own
+    commit() and rollback() calls work as usual but nothing it writes
+    outlives the test and no table clearing is needed. Lazy loads that
+    would emit SQL raise; see ``_raise_on_lazy_sql``.
+    """
+    async with engine.connect() as conn:
+        trans = await conn.begin()
+        session = AsyncSession(
+            bind=conn,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
+        event.listen(session.sync_session, "do_orm_execute", _raise_on_lazy_sql)
         try:
             yield session
         finally:
-            await session.rollback()
+            await session.close()
+            await trans.rollback()
 
 
 @pytest.fixture
-async def db_session():
+async def db(db_engine):
+    """Database session fixture for tests."""
+    async with transactional_session(db_engine) as session:
+        yield session
+
+
+@pytest.fixture
+async def db_session(db_engine):
     """Alternative database session fixture for tests."""
-    async with get_async_session_local()() as session:
-        try:
-            yield session
-        finally:
-            await session.rollback()
+    async with transactional_session(db_engine) as session:
+        yield session
+
+
+@pytest.fixture(scope="session")
+async def db_engine():
+    """Create the database schema once for the whole test session."""
+    # Tests are short-lived, so skip pooling and pre-ping on server
+    # databases. They connect directly rather than through pgbouncer, so
+    # asyncpg's prepared statement cache can stay enabled.
+    # Drop any engine created at import time so these settings take effect.
+    await close_db()
+    engine = get_engine(TEST_DATABASE_URL, null_pool=True)
+    
+    if engine.dialect.name == "sqlite":
+        # The sqlite driver defers BEGIN until the first write, which breaks
+        # SAVEPOINTs; take over transaction control so they nest correctly
+        @event.listens_for(engine.sync_engine, "connect")
+        def _configure_sqlite(dbapi_connection, connection_record):
+            dbapi_connection.isolation_level = None
+            # Test data is disposable: skip per-commit fsyncs and keep temp
+            # tables and a larger page cache in memory. These only matter
+            # when TEST_DATABASE_URL points at a file; in-memory databases
+            # ignore the journal settings.
+            cursor = dbapi_connection.cursor()
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+            cursor.execute("PRAGMA temp_store=MEMORY")
+            cursor.execute("PRAGMA cache_size=-64000")
+            cursor.close()
+        
+        @event.listens_for(engine.sync_engine, "begin")
+        def _emit_begin(conn):
+            conn.exec_driver_sql("BEGIN")
+    
+    await init_db(TEST_DATABASE_URL)
+    yield engine
+    await close_db()
 
 
-@pytest.fixture(autouse=True)
-async def setup_test_db():
-    """Setup test database before each test."""
-    await init_db()
+@pytest.fixture
+async def setup_test_db(db_engine):
+    """
+    Start each test with empty tables.
+    
+    Opt in per module with ``pytestmark = pytest.mark.usefixtures("setup_test_db")``
+    so pure in-memory tests don't pay for an event loop and table clearing.
+    """
     await clear_test_data()
     yield
     await clear_test_data()
 
 
+def build_model(model, **values):
+    """
+    Build a mapped instance without running its constructor.
+    
+    Values are stored as already-loaded state, skipping the per-attribute
+    change tracking that ``Model(**values)`` performs. Use it only where the
+    constructor itself is not under test.
+    """
+    # Normally triggered by the first constructor call; a no-op once done
+    configure_mappers()
+    instance = model.__mapper__.class_manager.new_instance()
+    for key, value in values.items():
+        set_committed_value(instance, key, value)
+    return instance
+
+
+@pytest.fixture
+def make_model():
+    """Fast model factory for tests that only exercise instance methods."""
+    return build_model
+
+
+@contextmanager
+def record_queries(db: AsyncSession):
+    """
+    Collect the SQL statements a session sends while the block runs.
+    
+    Wrap a query and the attribute access that follows it to pin its
+    round trips, so a lazy load or N+1 regression fails the test::
+    
+        with count_queries(db) as statements:
+            ...
+        assert len(statements) <= 3
+    """
+    statements = []
+    
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+    
+    target = db.sync_session.bind
+    event.listen(target, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(target, "before_cursor_execute", _record)
+
+
+@pytest.fixture
+def count_queries():
+    """Statement recorder for asserting how many queries a block issues."""
+    return record_queries
+
+
+# The create_test_* helpers don't refresh after committing: the session
+# factory uses expire_on_commit=False and the INSERT already hands back
+# generated ids and server defaults via RETURNING. The plural variants send
+# all rows in one statement, which SQLAlchemy batches as insertmanyvalues.
+
+
+async def create_test_users(db: AsyncSession, specs: List[Dict[str, Any]]) -> List[User]:
+    """
+    Create test users with a single multi-row INSERT.
+    
+    Each spec needs an ``email``; any other User column can be given to
+    override the defaults. Users are returned in the order of ``specs``.
+    """
+    rows = [
+        {
+            "id": uuid.uuid4(),
+            "hashed_password": "hashed_password_123",
+            "first_name": "Test",
+            "last_name": "User",
+            "is_active": True,
+            "is_superuser": False,
+            "is_verified": True,
+            **spec,
+        }
+        for spec in specs
+    ]
+    result = await db.execute(
+        insert(User).returning(User, sort_by_parameter_order=True), rows
+    )
+    users = list(result.scalars())
+    await db.commit()
+    return users
+
+
 async def create_test_user(
     db: AsyncSession,
     email: str = "test@example.com",
@@ -71,20 +274,41 @@ async def create_test_user(
     is_superuser: bool = False
 ) -> User:
     """Create a test user."""
-    user = User(
-        id=uuid.uuid4(),
-        email=email,
-        hashed_password="hashed_password_123",
-        first_name=first_name,
-        last_name=last_name,
-        is_active=True,
-        is_superuser=is_superuser,
-        is_verified=True
+    users = await create_test_users(db, [{
+        "email": email,
+        "first_name": first_name,
+        "last_name": last_name,
+        "is_superuser": is_superuser,
+    }])
+    return users[0]
+
+
+async def create_test_roles(db: AsyncSession, specs: List[Dict[str, Any]]) -> List[Role]:
+    """
+    Create test roles with a single multi-row INSERT.
+    
+    Each spec needs a ``name``; ``permissions`` is given as a list and
+    defaults to ``["read", "write"]`` when missing or None. Permissions are
+    serialised through ``Role.set_permissions_list`` so they match roles
+    built directly. Roles are returned in the order of ``specs``.
+    """
+    rows = []
+    for spec in specs:
+        row = {"description": "Test role", "is_active": True, **spec}
+        permissions = row.get("permissions")
+        if permissions is None:
+            permissions = ["read", "write"]
+        serialiser = build_model(Role)
+        serialiser.set_permissions_list(permissions)
+        row["permissions"] = serialiser.permissions
+        rows.append(row)
+    
+    result = await db.execute(
+        insert(Role).returning(Role, sort_by_parameter_order=True), rows
     )
-    db.add(user)
+    roles = list(result.scalars())
     await db.commit()
-    await db.refresh(user)
-    return user
+    return roles
 
 
 async def create_test_role(
@@ -94,20 +318,35 @@ async def create_test_role(
     permissions: list = None
 ) -> Role:
     """Create a test role."""
-    if permissions is None:
-        permissions = ["read", "write"]
-    
-    role = Role(
-        name=name,
-        description=description,
-        is_active=True
+    roles = await create_test_roles(db, [{
+        "name": name,
+        "description": description,
+        "permissions": permissions,
+    }])
+    return roles[0]
+
+
+async def create_test_user_roles(
+    db: AsyncSession,
+    pairs: List[Tuple[User, Role]],
+    assigned_by: User
+) -> List[UserRole]:
+    """Assign roles to users with a single multi-row INSERT."""
+    rows = [
+        {
+            "user_id": user.id,
+            "role_id": role.id,
+            "assigned_by": assigned_by.id,
+            "is_active": True,
+        }
+        for user, role in pairs
+    ]
+    result = await db.execute(
+        insert(UserRole).returning(UserRole, sort_by_parameter_order=True), rows
     )
-    role.set_permissions_list(permissions)
-    
-    db.add(role)
+    user_roles = list(result.scalars())
     await db.commit()
-    await db.refresh(role)
-    return role
+    return user_roles
 
 
 async def create_test_user_role(
@@ -117,16 +356,8 @@ async def create_test_user_role(
     assigned_by: User
 ) -> UserRole:
     """Create a test user role assignment."""
-    user_role = UserRole(
-        user_id=user.id,
-        role_id=role.id,
-        assigned_by=assigned_by.id,
-        is_active=True
-    )
-    db.add(user_role)
-    await db.commit()
-    await db.refresh(user_role)
-    return user_role
+    user_roles = await create_test_user_roles(db, [(user, role)], assigned_by)
+    return user_roles[0]
 
 
 async def create_test_resume(
@@ -156,7 +387,6 @@ async def create_test_resume(
     
     db.add(resume)
     await db.commit()
-    await db.refresh(resume)
     return resume
 
 
@@ -186,5 +416,4 @@ async def create_test_score(
     
     db.add(score)
     await db.commit()
-    await db.refresh(score)
     return score
@@ -0,0 +1,72 @@
+"""
+Micro-benchmarks for role model hot paths.
+
+These use pytest-benchmark for warmed-up, statistically summarised timings
+instead of hand-rolled wall-clock thresholds. Under pytest-xdist the plugin
+disables timing and each benchmark runs once as a plain test; run them
+serially to measure and compare against a saved baseline:
+
+    pytest tests/performance/test_role_benchmarks.py -n 0 --benchmark-autosave
+    pytest tests/performance/test_role_benchmarks.py -n 0 \\
+        --benchmark-compare --benchmark-compare-fail=mean:30%
+
+Author: AI Job Readiness Team
+Version: 1.0.0
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from app.models.user import User
+from app.models.role import Role, UserRole
+
+
+_PERMISSIONS = ["users:read", "users:write", "roles:read", "roles:write", "reports:read"]
+
+
+@pytest.fixture
+def role(make_model):
+    """Role with a realistic permission list, built without a database."""
+    role = make_model(Role, id=1, name="manager", description="Manager role", is_active=True)
+    role.set_permissions_list(_PERMISSIONS)
+    return role
+
+
+@pytest.mark.benchmark(group="roles")
+def test_role_has_permission(benchmark, role):
+    """Benchmark a permission check against the stored JSON list."""
+    assert benchmark(role.has_permission, "reports:read") is True
+
+
+@pytest.mark.benchmark(group="roles")
+def test_role_to_dict(benchmark, role):
+    """Benchmark role serialization."""
+    role_dict = benchmark(role.to_dict)
+    assert {"id", "name", "permissions", "is_active"} <= role_dict.keys()
+
+
+@pytest.mark.benchmark(group="roles")
+def test_user_get_role_names(benchmark, make_model):
+    """Benchmark User.get_role_names() over a loaded assignment list."""
+    role_names = [f"role_{i}" for i in range(10)]
+    user = make_model(
+        User,
+        email="bench@example.com",
+        hashed_password="hashed_password_123",
+        first_name="Bench",
+        last_name="User",
+        is_active=True,
+        roles=[
+            make_model(
+                UserRole,
+                id=i,
+                role_id=i,
+                role=make_model(Role, id=i, name=name, is_active=True),
+                is_active=True,
+            )
+            for i, name in enumerate(role_names)
+        ],
+    )
+    
+    assert sorted(benchmark(user.get_role_names)) == role_names
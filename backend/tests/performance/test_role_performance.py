@@ -13,114 +13,160 @@ Version: 1.0.0
 """
 
 import asyncio
+import json
 import time
+import tracemalloc
 import random
 import sys
+import traceback
 from pathlib import Path
 from typing import List, Dict, Any
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select, insert, func, event, lambda_stmt
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import selectinload
 
 # Add the backend directory to Python path
 backend_dir = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(backend_dir))
 
-from app.db.database import get_async_session_local, init_db
+from app.db.database import get_async_session_local, get_engine, init_db
 from app.models.user import User
 from app.models.role import Role, UserRole
 
+# Dialect-specific INSERT constructs that support ON CONFLICT DO NOTHING
+ON_CONFLICT_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+# Batches larger than this are streamed with COPY on PostgreSQL (asyncpg)
+COPY_THRESHOLD = 100
+
+
+async def bulk_insert_roles(db: AsyncSession, rows: List[Dict[str, Any]]) -> None:
+    """
+    Insert role rows in bulk.
+    
+    Large batches on PostgreSQL go through asyncpg's copy_records_to_table,
+    which streams every row through the bulk-load path in one command. Other
+    backends and small batches use a batched INSERT.
+    
+    COPY runs on the session's own connection inside the session's
+    transaction, so it commits or rolls back together with the rest of the
+    session's work. It bypasses SQLAlchemy entirely, though: Python-side
+    column defaults, onupdate hooks and ORM events do not run. Columns left
+    out of the rows must have server defaults (id and created_at do);
+    anything else has to be supplied explicitly.
+    """
+    dialect = db.get_bind().dialect
+    if len(rows) > COPY_THRESHOLD and dialect.name == "postgresql" and dialect.driver == "asyncpg":
+        columns = list(rows[0])
+        if not db.in_transaction():
+            await db.begin()
+        # Send pending ORM changes first so COPY sees them in order
+        await db.flush()
+        conn = await db.connection()
+        raw = await conn.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            Role.__tablename__,
+            records=[tuple(row[column] for column in columns) for row in rows],
+            columns=columns,
+        )
+    else:
+        await db.execute(insert(Role), rows)
+
 
 class PerformanceTester:
     """Performance testing class for Role Management System."""
     
     def __init__(self):
         self.results = {}
+        # Time spent inside DBAPI cursor execution, to tell slow queries
+        # apart from slow Python in the wall-clock numbers
+        self.sql_time_ns = 0
+    
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start_ns", []).append(time.perf_counter_ns())
+    
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.sql_time_ns += time.perf_counter_ns() - conn.info["query_start_ns"].pop()
         
     async def setup_test_data(self, num_roles: int = 100, num_users: int = 1000):
         """Create test data for performance testing."""
         print(f"📊 Setting up test data: {num_roles} roles, {num_users} users...")
         
         async with get_async_session_local()() as db:
-            # Create roles
-            roles = []
-            for i in range(num_roles):
-                role = Role(
-                    name=f"role_{i:03d}",
-                    description=f"Test role {i}",
-                    is_active=True
-                )
-                # Assign random permissions
-                permissions = random.sample([
-                    "read", "write", "delete", "create", "update", "view", "edit", "manage"
-                ], random.randint(1, 4))
-                role.set_permissions_list(permissions)
-                roles.append(role)
-            
-            db.add_all(roles)
-            await db.commit()
+            # Create roles; INSERT ... RETURNING hands back the ids in one
+            # batched statement instead of building and flushing ORM objects
+            role_rows = [
+                {
+                    "name": f"role_{i:03d}",
+                    "description": f"Test role {i}",
+                    # Assign random permissions
+                    "permissions": json.dumps(random.sample([
+                        "read", "write", "delete", "create", "update", "view", "edit", "manage"
+                    ], random.randint(1, 4))),
+                    "is_active": True,
+                }
+                for i in range(num_roles)
+            ]
+            result = await db.execute(insert(Role).returning(Role.id), role_rows)
+            role_ids = result.scalars().all()
             
             # Create users
-            users = []
-            for i in range(num_users):
-                user = User(
-                    email=f"user_{i:04d}@test.com",
-                    hashed_password="hashed_password_123",
-                    first_name=f"User{i}",
-                    last_name="Test",
-                    is_active=True,
-                    is_superuser=False,
-                    is_verified=True
-                )
-                users.append(user)
-            
-            db.add_all(users)
-            await db.commit()
+            user_rows = [
+                {
+                    "email": f"user_{i:04d}@test.com",
+                    "hashed_password": "hashed_password_123",
+                    "first_name": f"User{i}",
+                    "last_name": "Test",
+                    "is_active": True,
+                    "is_superuser": False,
+                    "is_verified": True,
+                }
+                for i in range(num_users)
+            ]
+            result = await db.execute(insert(User).returning(User.id), user_rows)
+            user_ids = result.scalars().all()
             
             # Create role assignments (random assignments)
-            assignments = []
-            for user in users:
+            assignment_rows = []
+            for user_id in user_ids:
                 # Each user gets 1-3 random roles
                 num_user_roles = random.randint(1, 3)
-                user_roles = random.sample(roles, min(num_user_roles, len(roles)))
-                
-                for role in user_roles:
-                    assignment = UserRole(
-                        user_id=user.id,
-                        role_id=role.id,
-                        assigned_by=user.id,  # Self-assignment for testing
-                        is_active=True
-                    )
-                    assignments.append(assignment)
+                for role_id in random.sample(role_ids, min(num_user_roles, len(role_ids))):
+                    assignment_rows.append({
+                        "user_id": user_id,
+                        "role_id": role_id,
+                        "assigned_by": user_id,  # Self-assignment for testing
+                        "is_active": True,
+                    })
             
-            db.add_all(assignments)
+            await db.execute(insert(UserRole), assignment_rows)
             await db.commit()
             
-            print(f"✅ Created {len(roles)} roles, {len(users)} users, {len(assignments)} assignments")
-            return len(roles), len(users), len(assignments)
+            print(f"✅ Created {len(role_ids)} roles, {len(user_ids)} users, {len(assignment_rows)} assignments")
+            return len(role_ids), len(user_ids), len(assignment_rows)
     
     async def test_role_creation_performance(self, num_roles: int = 1000):
         """Test role creation performance."""
         print(f"\n⚡ Testing role creation performance ({num_roles} roles)...")
         
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         
+        permissions = json.dumps(["read", "write"])
         async with get_async_session_local()() as db:
-            roles = []
-            for i in range(num_roles):
-                role = Role(
-                    name=f"perf_role_{i:04d}",
-                    description=f"Performance test role {i}",
-                    is_active=True
-                )
-                role.set_permissions_list(["read", "write"])
-                roles.append(role)
-            
-            db.add_all(roles)
+            await bulk_insert_roles(db, [
+                {
+                    "name": f"perf_role_{i:04d}",
+                    "description": f"Performance test role {i}",
+                    "permissions": permissions,
+                    "is_active": True,
+                }
+                for i in range(num_roles)
+            ])
             await db.commit()
         
-        end_time = time.time()
-        duration = end_time - start_time
+        end_time = time.perf_counter_ns()
+        duration = (end_time - start_time) / 1e9
         roles_per_second = num_roles / duration
         
         self.results["role_creation"] = {
@@ -136,7 +182,7 @@ class PerformanceTester:
         """Test user creation performance."""
         print(f"\n⚡ Testing user creation performance ({num_users} users)...")
         
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         
         async with get_async_session_local()() as db:
             users = []
@@ -155,8 +201,8 @@ class PerformanceTester:
             db.add_all(users)
             await db.commit()
         
-        end_time = time.time()
-        duration = end_time - start_time
+        end_time = time.perf_counter_ns()
+        duration = (end_time - start_time) / 1e9
         users_per_second = num_users / duration
         
         self.results["user_creation"] = {
@@ -184,82 +230,110 @@ class PerformanceTester:
             print("❌ No roles or users available for assignment testing")
             return 0
         
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         
         async with get_async_session_local()() as db:
-            assignments = []
+            assignment_rows = []
             for i in range(num_assignments):
                 user = random.choice(users)
                 role = random.choice(roles)
-                
-                assignment = UserRole(
-                    user_id=user.id,
-                    role_id=role.id,
-                    assigned_by=user.id,
-                    is_active=True
+                assignment_rows.append({
+                    "user_id": user.id,
+                    "role_id": role.id,
+                    "assigned_by": user.id,
+                    "is_active": True,
+                })
+            
+            # Random pairs repeat, so skip the ones that would violate the
+            # (user_id, role_id) unique constraint instead of failing the batch
+            bind = db.get_bind()
+            dialect_insert = ON_CONFLICT_INSERTS.get(bind.dialect.name)
+            if dialect_insert is not None:
+                stmt = dialect_insert(UserRole).on_conflict_do_nothing(
+                    index_elements=["user_id", "role_id"]
                 )
-                assignments.append(assignment)
+            else:
+                stmt = insert(UserRole)
+            
+            statements = []
             
-            db.add_all(assignments)
+            def count_statement(conn, cursor, statement, parameters, context, executemany):
+                statements.append(statement)
+            
+            event.listen(bind, "before_cursor_execute", count_statement)
+            try:
+                await db.execute(stmt, assignment_rows)
+            finally:
+                event.remove(bind, "before_cursor_execute", count_statement)
             await db.commit()
         
-        end_time = time.time()
-        duration = end_time - start_time
+        end_time = time.perf_counter_ns()
+        duration = (end_time - start_time) / 1e9
         assignments_per_second = num_assignments / duration
         
         self.results["role_assignment"] = {
             "duration": duration,
             "assignments_per_second": assignments_per_second,
-            "total_assignments": num_assignments
+            "total_assignments": num_assignments,
+            "insert_statements": len(statements)
         }
         
-        print(f"✅ Created {num_assignments} assignments in {duration:.2f}s ({assignments_per_second:.2f} assignments/sec)")
+        print(f"✅ Created {num_assignments} assignments in {duration:.2f}s ({assignments_per_second:.2f} assignments/sec, {len(statements)} INSERT statement(s))")
         return duration
     
     async def test_query_performance(self):
         """Test query performance for common operations."""
         print(f"\n⚡ Testing query performance...")
         
+        # Queries are wrapped in lambda_stmt so repeated runs reuse the cached
+        # statement instead of rebuilding and re-keying it each time
+        
         # Test 1: Get all users with their roles
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         async with get_async_session_local()() as db:
             users_result = await db.execute(
-                select(User).options(
-                    selectinload(User.roles).selectinload(UserRole.role)
-                ).limit(100)
+                lambda_stmt(
+                    lambda: select(User).options(
+                        selectinload(User.roles).selectinload(UserRole.role)
+                    ).limit(100)
+                )
             )
             users = users_result.scalars().all()
-        end_time = time.time()
-        user_query_time = end_time - start_time
+        end_time = time.perf_counter_ns()
+        user_query_time = (end_time - start_time) / 1e9
         
         # Test 2: Get all roles with user counts
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         async with get_async_session_local()() as db:
             roles_result = await db.execute(
-                select(Role).options(
-                    selectinload(Role.user_roles).selectinload(UserRole.user)
+                lambda_stmt(
+                    lambda: select(Role).options(
+                        selectinload(Role.user_roles).selectinload(UserRole.user)
+                    )
                 )
             )
             roles = roles_result.scalars().all()
-        end_time = time.time()
-        role_query_time = end_time - start_time
+        end_time = time.perf_counter_ns()
+        role_query_time = (end_time - start_time) / 1e9
         
         # Test 3: Count operations
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         async with get_async_session_local()() as db:
-            user_count = await db.execute(select(func.count(User.id)))
-            role_count = await db.execute(select(func.count(Role.id)))
-            assignment_count = await db.execute(select(func.count(UserRole.id)))
-        end_time = time.time()
-        count_query_time = end_time - start_time
+            user_count = await db.execute(lambda_stmt(lambda: select(func.count(User.id))))
+            role_count = await db.execute(lambda_stmt(lambda: select(func.count(Role.id))))
+            assignment_count = await db.execute(lambda_stmt(lambda: select(func.count(UserRole.id))))
+        end_time = time.perf_counter_ns()
+        count_query_time = (end_time - start_time) / 1e9
         
         # Test 4: Permission checking
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         async with get_async_session_local()() as db:
             users_result = await db.execute(
-                select(User).options(
-                    selectinload(User.roles).selectinload(UserRole.role)
-                ).limit(50)
+                lambda_stmt(
+                    lambda: select(User).options(
+                        selectinload(User.roles).selectinload(UserRole.role)
+                    ).limit(50)
+                )
             )
             users = users_result.scalars().all()
             
@@ -267,8 +341,8 @@ class PerformanceTester:
                 for user_role in user.roles:
                     if user_role.role:
                         user_role.role.has_permission("read")
-        end_time = time.time()
-        permission_check_time = end_time - start_time
+        end_time = time.perf_counter_ns()
+        permission_check_time = (end_time - start_time) / 1e9
         
         self.results["queries"] = {
             "user_query_time": user_query_time,
@@ -313,14 +387,14 @@ class PerformanceTester:
                     db.add(assignment)
                     await db.commit()
         
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         
         # Run concurrent operations
         tasks = [create_role_assignment() for _ in range(num_operations)]
         await asyncio.gather(*tasks, return_exceptions=True)
         
-        end_time = time.time()
-        duration = end_time - start_time
+        end_time = time.perf_counter_ns()
+        duration = (end_time - start_time) / 1e9
         operations_per_second = num_operations / duration
         
         self.results["concurrent_operations"] = {
@@ -336,37 +410,36 @@ class PerformanceTester:
         """Test memory usage with large datasets."""
         print(f"\n⚡ Testing memory usage...")
         
+        # tracemalloc counts the Python allocations made while loading,
+        # unlike process RSS, which never shrinks and includes unrelated noise
+        tracemalloc.start()
         try:
-            import psutil
-            import os
-        except ImportError:
-            print("⚠️ psutil not available, skipping memory usage test")
-            return 0
-        
-        process = psutil.Process(os.getpid())
-        initial_memory = process.memory_info().rss / 1024 / 1024  # MB
-        
-        # Load large dataset
-        async with get_async_session_local()() as db:
-            users_result = await db.execute(
-                select(User).options(
-                    selectinload(User.roles).selectinload(UserRole.role)
-                )
-            )
-            users = users_result.scalars().all()
+            baseline, _ = tracemalloc.get_traced_memory()
             
-            roles_result = await db.execute(
-                select(Role).options(
-                    selectinload(Role.user_roles).selectinload(UserRole.user)
+            # Load large dataset
+            async with get_async_session_local()() as db:
+                users_result = await db.execute(
+                    select(User).options(
+                        selectinload(User.roles).selectinload(UserRole.role)
+                    )
                 )
-            )
-            roles = roles_result.scalars().all()
+                users = users_result.scalars().all()
+                
+                roles_result = await db.execute(
+                    select(Role).options(
+                        selectinload(Role.user_roles).selectinload(UserRole.user)
+                    )
+                )
+                roles = roles_result.scalars().all()
+            
+            current, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
         
-        peak_memory = process.memory_info().rss / 1024 / 1024  # MB
-        memory_used = peak_memory - initial_memory
+        memory_used = (current - baseline) / 1024 / 1024  # MB
+        peak_memory = (peak - baseline) / 1024 / 1024  # MB
         
         self.results["memory_usage"] = {
-            "initial_memory_mb": initial_memory,
             "peak_memory_mb": peak_memory,
             "memory_used_mb": memory_used,
             "users_loaded": len(users),
@@ -374,9 +447,8 @@ class PerformanceTester:
         }
         
         print(f"✅ Memory usage results:")
-        print(f"   - Initial memory: {initial_memory:.2f} MB")
-        print(f"   - Peak memory: {peak_memory:.2f} MB")
-        print(f"   - Memory used: {memory_used:.2f} MB")
+        print(f"   - Peak allocated while loading: {peak_memory:.2f} MB")
+        print(f"   - Retained after loading: {memory_used:.2f} MB")
         print(f"   - Users loaded: {len(users)}")
         print(f"   - Roles loaded: {len(roles)}")
         
@@ -416,6 +488,8 @@ class PerformanceTester:
             r = self.results["memory_usage"]
             print(f"Memory Usage: {r['memory_used_mb']:.2f} MB for {r['users_loaded']} users, {r['roles_loaded']} roles")
         
+        print(f"Time in SQL execution: {self.sql_time_ns / 1e9:.3f}s")
+        
         print("="*60)
     
     async def run_all_tests(self):
@@ -426,6 +500,10 @@ class PerformanceTester:
             # Initialize database
             await init_db()
             
+            sync_engine = get_engine().sync_engine
+            event.listen(sync_engine, "before_cursor_execute", self._before_cursor_execute)
+            event.listen(sync_engine, "after_cursor_execute", self._after_cursor_execute)
+            
             # Setup test data
             await self.setup_test_data(50, 200)  # Smaller dataset for performance testing
             
@@ -445,7 +523,6 @@ class PerformanceTester:
             
         except Exception as e:
             print(f"\n❌ Performance test failed with error: {e}")
-            import traceback
             traceback.print_exc()
             return False
 
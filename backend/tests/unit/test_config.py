@@ -0,0 +1,27 @@
+"""
+Unit tests for application configuration.
+
+This module verifies that the settings object loads with all required
+values populated.
+
+Author: AI Job Readiness Team
+Version: 1.0.0
+"""
+
+from app.core.config import settings
+
+
+class TestSettings:
+    """Test application settings."""
+
+    def test_configuration(self):
+        """Test that required settings are present in a single dump."""
+        cfg = settings.model_dump()
+
+        assert cfg["environment"]
+        assert cfg["database"]["url"]
+        assert cfg["security"]["secret_key"]
+        assert cfg["security"]["users_secret"]
+        assert cfg["security"]["access_token_expire_minutes"] > 0
+        assert cfg["api"]["project_name"]
+        assert len(cfg["api"]["cors_origins"]) > 0
@@ -11,6 +11,7 @@ Version: 1.0.0
 import pytest
 import uuid
 from datetime import datetime
+from typing import Final
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
@@ -21,6 +22,53 @@ from app.models.resume import Resume
 from app.models.score import Score
 
 
+# (model, constructor kwargs with one NOT NULL column left as None). None of
+# these need parent rows: the NOT NULL check fails before any foreign key one
+_NOT_NULL_CASES: Final = (
+    pytest.param(
+        User,
+        {"email": None, "hashed_password": "hashed_password_123",
+         "is_active": True, "is_superuser": False, "is_verified": True},
+        id="user-email",
+    ),
+    pytest.param(
+        User,
+        {"email": "test@example.com", "hashed_password": None,
+         "is_active": True, "is_superuser": False, "is_verified": True},
+        id="user-hashed_password",
+    ),
+    pytest.param(
+        Role,
+        {"name": None, "description": "Test role", "is_active": True},
+        id="role-name",
+    ),
+    pytest.param(
+        Resume,
+        {"user_id": None, "title": "Test Resume"},
+        id="resume-user_id",
+    ),
+    pytest.param(
+        Score,
+        {"user_id": None, "resume_id": 1, "analysis_type": "overall", "overall_score": 85.5},
+        id="score-user_id",
+    ),
+)
+
+
+class TestRequiredColumns:
+    """Test NOT NULL constraints that need no related rows."""
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("model,values", _NOT_NULL_CASES)
+    async def test_required_column_rejects_null(self, db, model, values):
+        """Test that saving without a required column fails."""
+        db.add(model(**values))
+        
+        # Should raise IntegrityError due to NOT NULL constraint
+        with pytest.raises(IntegrityError):
+            await db.commit()
+
+
 class TestUserConstraints:
     """Test User model constraints and validation."""
     
@@ -37,7 +85,6 @@ class TestUserConstraints:
         )
         db.add(user1)
         await db.commit()
-        await db.refresh(user1)
         
         # Try to create second user with same email
         user2 = User(
@@ -53,38 +100,6 @@ class TestUserConstraints:
         with pytest.raises(IntegrityError):
             await db.commit()
     
-    @pytest.mark.asyncio
-    async def test_user_email_required(self, db):
-        """Test that user email is required."""
-        user = User(
-            email=None,  # No email
-            hashed_password="hashed_password_123",
-            is_active=True,
-            is_superuser=False,
-            is_verified=True
-        )
-        db.add(user)
-        
-        # Should raise IntegrityError due to NOT NULL constraint
-        with pytest.raises(IntegrityError):
-            await db.commit()
-    
-    @pytest.mark.asyncio
-    async def test_user_hashed_password_required(self, db):
-        """Test that user hashed_password is required."""
-        user = User(
-            email="test@example.com",
-            hashed_password=None,  # No password
-            is_active=True,
-            is_superuser=False,
-            is_verified=True
-        )
-        db.add(user)
-        
-        # Should raise IntegrityError due to NOT NULL constraint
-        with pytest.raises(IntegrityError):
-            await db.commit()
-    
     @pytest.mark.asyncio
     async def test_user_boolean_field_defaults(self, db):
         """Test that boolean fields have correct defaults."""
@@ -116,7 +131,6 @@ class TestUserConstraints:
         )
         db.add(user)
         await db.commit()
-        await db.refresh(user)
         
         # Should succeed with null optional fields
         assert user.first_name is None
@@ -140,7 +154,6 @@ class TestRoleConstraints:
         )
         db.add(role1)
         await db.commit()
-        await db.refresh(role1)
         
         # Try to create second role with same name
         role2 = Role(
@@ -154,20 +167,6 @@ class TestRoleConstraints:
         with pytest.raises(IntegrityError):
             await db.commit()
     
-    @pytest.mark.asyncio
-    async def test_role_name_required(self, db):
-        """Test that role name is required."""
-        role = Role(
-            name=None,  # No name
-            description="Test role",
-            is_active=True
-        )
-        db.add(role)
-        
-        # Should raise IntegrityError due to NOT NULL constraint
-        with pytest.raises(IntegrityError):
-            await db.commit()
-    
     @pytest.mark.asyncio
     async def test_role_boolean_field_defaults(self, db):
         """Test that boolean fields have correct defaults."""
@@ -192,7 +191,6 @@ class TestRoleConstraints:
         )
         db.add(role)
         await db.commit()
-        await db.refresh(role)
         
         # Should succeed with null optional fields
         assert role.description is None
@@ -211,7 +209,6 @@ class TestUserRoleConstraints:
         )
         db.add(role)
         await db.commit()
-        await db.refresh(role)
         
         user_role = UserRole(
             user_id=None,  # No user_id
@@ -236,7 +233,6 @@ class TestUserRoleConstraints:
         )
         db.add(user)
         await db.commit()
-        await db.refresh(user)
         
         user_role = UserRole(
             user_id=user.id,
@@ -310,7 +306,6 @@ class TestUserRoleConstraints:
         )
         db.add(user)
         await db.commit()
-        await db.refresh(user)
         
         role = Role(
             name="test_role",
@@ -318,7 +313,6 @@ class TestUserRoleConstraints:
         )
         db.add(role)
         await db.commit()
-        await db.refresh(role)
         
         user_role = UserRole(
             user_id=user.id,
@@ -327,7 +321,6 @@ class TestUserRoleConstraints:
         )
         db.add(user_role)
         await db.commit()
-        await db.refresh(user_role)
         
         # Should succeed with null optional field
         assert user_role.assigned_by is None
@@ -336,19 +329,6 @@ class TestUserRoleConstraints:
 class TestResumeConstraints:
     """Test Resume model constraints and validation."""
     
-    @pytest.mark.asyncio
-    async def test_resume_user_id_required(self, db):
-        """Test that user_id is required."""
-        resume = Resume(
-            user_id=None,  # No user_id
-            title="Test Resume"
-        )
-        db.add(resume)
-        
-        # Should raise IntegrityError due to NOT NULL constraint
-        with pytest.raises(IntegrityError):
-            await db.commit()
-    
     @pytest.mark.asyncio
     async def test_resume_title_required(self, db):
         """Test that title is required."""
@@ -361,7 +341,6 @@ class TestResumeConstraints:
         )
         db.add(user)
         await db.commit()
-        await db.refresh(user)
         
         resume = Resume(
             user_id=user.id,
@@ -426,7 +405,6 @@ class TestResumeConstraints:
         )
         db.add(user)
         await db.commit()
-        await db.refresh(user)
         
         resume = Resume(
             user_id=user.id,
@@ -444,7 +422,6 @@ class TestResumeConstraints:
         )
         db.add(resume)
         await db.commit()
-        await db.refresh(resume)
         
         # Should succeed with null optional fields
         assert resume.file_path is None
@@ -462,21 +439,6 @@ class TestResumeConstraints:
 class TestScoreConstraints:
     """Test Score model constraints and validation."""
     
-    @pytest.mark.asyncio
-    async def test_score_user_id_required(self, db):
-        """Test that user_id is required."""
-        score = Score(
-            user_id=None,  # No user_id
-            resume_id=1,
-            analysis_type="overall",
-            overall_score=85.5
-        )
-        db.add(score)
-        
-        # Should raise IntegrityError due to NOT NULL constraint
-        with pytest.raises(IntegrityError):
-            await db.commit()
-    
     @pytest.mark.asyncio
     async def test_score_resume_id_required(self, db):
         """Test that resume_id is required."""
@@ -489,7 +451,6 @@ class TestScoreConstraints:
         )
         db.add(user)
         await db.commit()
-        await db.refresh(user)
         
         score = Score(
             user_id=user.id,
@@ -515,7 +476,6 @@ class TestScoreConstraints:
         )
         db.add(user)
         await db.commit()
-        await db.refresh(user)
         
         score = Score(
             user_id=user.id,
@@ -541,7 +501,6 @@ class TestScoreConstraints:
         )
         db.add(user)
         await db.commit()
-        await db.refresh(user)
         
         score = Score(
             user_id=user.id,
@@ -611,7 +570,6 @@ class TestScoreConstraints:
         )
         db.add(user)
         await db.commit()
-        await db.refresh(user)
         
         score = Score(
             user_id=user.id,
@@ -630,7 +588,6 @@ class TestScoreConstraints:
         )
         db.add(score)
         await db.commit()
-        await db.refresh(score)
         
         # Should succeed with null optional fields
         assert score.job_title is None
@@ -660,7 +617,6 @@ class TestCascadeDeletionConstraints:
         )
         db.add(user)
         await db.commit()
-        await db.refresh(user)
         
         # Create role
         role = Role(
@@ -669,7 +625,6 @@ class TestCascadeDeletionConstraints:
         )
         db.add(role)
         await db.commit()
-        await db.refresh(role)
         
         # Create user-role relationship
         user_role = UserRole(
@@ -680,7 +635,6 @@ class TestCascadeDeletionConstraints:
         )
         db.add(user_role)
         await db.commit()
-        await db.refresh(user_role)
         
         # Create resume
         resume = Resume(
@@ -689,7 +643,6 @@ class TestCascadeDeletionConstraints:
         )
         db.add(resume)
         await db.commit()
-        await db.refresh(resume)
         
         # Create score
         score = Score(
@@ -700,7 +653,6 @@ class TestCascadeDeletionConstraints:
         )
         db.add(score)
         await db.commit()
-        await db.refresh(score)
         
         # Verify all records exist
         result = await db.execute(select(UserRole).where(UserRole.user_id == user.id))
@@ -750,7 +702,6 @@ class TestCascadeDeletionConstraints:
         )
         db.add(user)
         await db.commit()
-        await db.refresh(user)
         
         # Create resume
         resume = Resume(
@@ -759,7 +710,6 @@ class TestCascadeDeletionConstraints:
         )
         db.add(resume)
         await db.commit()
-        await db.refresh(resume)
         
         # Create scores for the resume
         score1 = Score(
@@ -776,8 +726,6 @@ class TestCascadeDeletionConstraints:
         )
         db.add_all([score1, score2])
         await db.commit()
-        await db.refresh(score1)
-        await db.refresh(score2)
         
         # Verify scores exist
         result = await db.execute(select(Score).where(Score.resume_id == resume.id))
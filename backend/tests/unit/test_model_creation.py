@@ -11,8 +11,14 @@ Version: 1.0.0
 import pytest
 import uuid
 from datetime import datetime
+from typing import Final
+from sqlalchemy import inspect
+from sqlalchemy.dialects import sqlite
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.schema import CreateTable
+
+from app.db.database import Base
 
 from app.models.user import User
 from app.models.role import Role, UserRole
@@ -20,6 +26,69 @@ from app.models.resume import Resume
 from app.models.score import Score
 
 
+# JSON-encoded column values shared across tests
+_PERMS_RW: Final = '["read", "write"]'
+_PERMS_RWD: Final = '["read", "write", "delete"]'
+_SKILLS: Final = '["Python", "JavaScript", "SQL"]'
+_LANGUAGES: Final = '[{"name": "English", "level": "Native"}]'
+_SKILL_MATCHES: Final = '["Python", "JavaScript"]'
+_SKILL_GAPS: Final = '["Docker", "Kubernetes"]'
+_ANALYSIS_DETAILS: Final = '{"confidence": 0.95}'
+
+# (overall_score, grade, level) cases for Score grading
+_SCORE_GRADES: Final = (
+    (98.0, "A+", "Excellent"),
+    (95.0, "A", "Excellent"),
+    (85.5, "B", "Excellent"),
+    (85.0, "B", "Excellent"),
+    (75.0, "C", "Good"),
+    (30.0, "F", "Poor"),
+)
+
+# Shared keyword arguments for users whose construction is not under test
+_USER_DEFAULTS: Final = {
+    "email": "test@example.com",
+    "hashed_password": "hashed_password_123",
+    "is_active": True,
+    "is_superuser": False,
+    "is_verified": True,
+}
+
+
+def _make_user(**overrides) -> User:
+    """Build a user from the shared defaults plus any overrides."""
+    return User(**{**_USER_DEFAULTS, **overrides})
+
+
+# Schema expectations, built once at import time
+_EXPECTED_TABLENAMES: Final = (
+    (User, "users"),
+    (Role, "roles"),
+    (UserRole, "user_roles"),
+    (Resume, "resumes"),
+    (Score, "scores"),
+)
+
+_EXPECTED_RELATIONSHIPS: Final = {
+    User: frozenset({"roles", "resumes", "scores"}),
+    Role: frozenset({"user_roles"}),
+    UserRole: frozenset({"user", "role"}),
+    Resume: frozenset({"scores"}),
+}
+
+_COLUMN_SAMPLES: Final = (
+    (User, {"email": "test@example.com", "hashed_password": "hashed_password_123",
+            "first_name": "John", "last_name": "Doe", "is_active": True}),
+    (Role, {"name": "admin", "description": "Administrator role",
+            "permissions": _PERMS_RW, "is_active": True}),
+    (UserRole, {"user_id": str(uuid.uuid4()), "role_id": 1, "is_active": True}),
+    (Resume, {"user_id": str(uuid.uuid4()), "title": "My Resume",
+              "file_name": "resume.pdf", "file_size": 1024000}),
+    (Score, {"user_id": str(uuid.uuid4()), "resume_id": 1,
+             "analysis_type": "overall", "overall_score": 85.5}),
+)
+
+
 class TestUserModelCreation:
     """Test User model creation and basic functionality."""
     
@@ -68,15 +137,7 @@ class TestUserModelCreation:
     
     def test_user_string_representations(self):
         """Test user string representations."""
-        user = User(
-            email="test@example.com",
-            hashed_password="hashed_password_123",
-            first_name="Jane",
-            last_name="Smith",
-            is_active=True,
-            is_superuser=False,
-            is_verified=True
-        )
+        user = _make_user(first_name="Jane", last_name="Smith")
         
         # Test __repr__
         repr_str = repr(user)
@@ -98,15 +159,7 @@ class TestUserModelCreation:
     
     def test_user_properties(self):
         """Test user properties and methods."""
-        user = User(
-            email="test@example.com",
-            hashed_password="hashed_password_123",
-            first_name="Alice",
-            last_name="Johnson",
-            is_active=True,
-            is_superuser=False,
-            is_verified=True
-        )
+        user = _make_user(first_name="Alice", last_name="Johnson")
         
         # Test full_name property
         assert user.full_name == "Alice Johnson"
@@ -126,13 +179,7 @@ class TestUserModelCreation:
     
     def test_user_role_methods(self):
         """Test user role-related methods."""
-        user = User(
-            email="test@example.com",
-            hashed_password="hashed_password_123",
-            is_active=True,
-            is_superuser=False,
-            is_verified=True
-        )
+        user = _make_user()
         
         # Test empty role methods
         assert user.get_role_names() == []
@@ -143,9 +190,10 @@ class TestUserModelCreation:
         user.is_superuser = True
         assert user.is_admin() is True
     
-    def test_user_to_dict(self):
+    def test_user_to_dict(self, make_model):
         """Test user to_dict method."""
-        user = User(
+        user = make_model(
+            User,
             email="test@example.com",
             hashed_password="hashed_password_123",
             first_name="Test",
@@ -168,9 +216,7 @@ class TestUserModelCreation:
         assert user_dict["is_active"] is True
         assert user_dict["is_superuser"] is False
         assert user_dict["is_verified"] is True
-        assert "id" in user_dict
-        assert "created_at" in user_dict
-        assert "roles" in user_dict
+        assert {"id", "created_at", "roles"} <= user_dict.keys()
 
 
 class TestRoleModelCreation:
@@ -194,13 +240,13 @@ class TestRoleModelCreation:
         role = Role(
             name="admin",
             description="Administrator role with full access",
-            permissions='["read", "write", "delete"]',
+            permissions=_PERMS_RWD,
             is_active=True
         )
         
         assert role.name == "admin"
         assert role.description == "Administrator role with full access"
-        assert role.permissions == '["read", "write", "delete"]'
+        assert role.permissions == _PERMS_RWD
         assert role.is_active is True
     
     def test_role_string_representations(self):
@@ -261,7 +307,7 @@ class TestRoleModelCreation:
         )
         
         # Test with valid JSON
-        role.permissions = '["read", "write"]'
+        role.permissions = _PERMS_RW
         assert role.get_permissions_list() == ["read", "write"]
         
         # Test with invalid JSON
@@ -276,9 +322,10 @@ class TestRoleModelCreation:
         role.permissions = ""
         assert role.get_permissions_list() == []
     
-    def test_role_to_dict(self):
+    def test_role_to_dict(self, make_model):
         """Test role to_dict method."""
-        role = Role(
+        role = make_model(
+            Role,
             name="admin",
             description="Administrator role",
             is_active=True
@@ -291,8 +338,7 @@ class TestRoleModelCreation:
         assert role_dict["description"] == "Administrator role"
         assert role_dict["permissions"] == ["read", "write", "delete"]
         assert role_dict["is_active"] is True
-        assert "id" in role_dict
-        assert "created_at" in role_dict
+        assert {"id", "created_at"} <= role_dict.keys()
 
 
 class TestUserRoleModelCreation:
@@ -370,13 +416,14 @@ class TestUserRoleModelCreation:
         # Test is_expired (currently always returns False)
         assert user_role.is_expired() is False
     
-    def test_user_role_to_dict(self):
+    def test_user_role_to_dict(self, make_model):
         """Test user role to_dict method."""
         user_id = uuid.uuid4()
         role_id = 1
         assigned_by = uuid.uuid4()
         
-        user_role = UserRole(
+        user_role = make_model(
+            UserRole,
             user_id=user_id,
             role_id=role_id,
             assigned_by=assigned_by,
@@ -389,9 +436,7 @@ class TestUserRoleModelCreation:
         assert user_role_dict["role_id"] == role_id
         assert user_role_dict["assigned_by"] == str(assigned_by)
         assert user_role_dict["is_active"] is True
-        assert "id" in user_role_dict
-        assert "assigned_at" in user_role_dict
-        assert "is_expired" in user_role_dict
+        assert {"id", "assigned_at", "is_expired"} <= user_role_dict.keys()
 
 
 class TestResumeModelCreation:
@@ -427,8 +472,8 @@ class TestResumeModelCreation:
             summary="Experienced software engineer",
             experience_years=5.5,
             education_level="Bachelor's Degree",
-            skills='["Python", "JavaScript", "SQL"]',
-            languages='[{"name": "English", "level": "Native"}]',
+            skills=_SKILLS,
+            languages=_LANGUAGES,
             is_active=True,
             is_public=True
         )
@@ -442,8 +487,8 @@ class TestResumeModelCreation:
         assert resume.summary == "Experienced software engineer"
         assert resume.experience_years == 5.5
         assert resume.education_level == "Bachelor's Degree"
-        assert resume.skills == '["Python", "JavaScript", "SQL"]'
-        assert resume.languages == '[{"name": "English", "level": "Native"}]'
+        assert resume.skills == _SKILLS
+        assert resume.languages == _LANGUAGES
         assert resume.is_active is True
         assert resume.is_public is True
     
@@ -565,10 +610,11 @@ class TestResumeModelCreation:
         assert resume.is_recently_analyzed() is True
         assert resume.is_recently_analyzed(1) is True  # Within 1 hour
     
-    def test_resume_to_dict(self):
+    def test_resume_to_dict(self, make_model):
         """Test resume to_dict method."""
         user_id = uuid.uuid4()
-        resume = Resume(
+        resume = make_model(
+            Resume,
             user_id=user_id,
             title="Test Resume",
             file_name="resume.pdf",
@@ -587,11 +633,7 @@ class TestResumeModelCreation:
         assert resume_dict["summary"] == "Test summary"
         assert resume_dict["skills"] == ["Python", "JavaScript"]
         # Note: is_active and is_public will be set by database defaults
-        assert "is_active" in resume_dict
-        assert "is_public" in resume_dict
-        assert "id" in resume_dict
-        assert "created_at" in resume_dict
-        assert "needs_analysis" in resume_dict
+        assert {"is_active", "is_public", "id", "created_at", "needs_analysis"} <= resume_dict.keys()
 
 
 class TestScoreModelCreation:
@@ -630,10 +672,10 @@ class TestScoreModelCreation:
             skill_score=88.0,
             experience_score=95.0,
             education_score=90.0,
-            skill_matches='["Python", "JavaScript"]',
-            skill_gaps='["Docker", "Kubernetes"]',
+            skill_matches=_SKILL_MATCHES,
+            skill_gaps=_SKILL_GAPS,
             recommendations="Consider learning containerization technologies",
-            analysis_details='{"confidence": 0.95}',
+            analysis_details=_ANALYSIS_DETAILS,
             is_active=True
         )
         
@@ -646,10 +688,10 @@ class TestScoreModelCreation:
         assert score.skill_score == 88.0
         assert score.experience_score == 95.0
         assert score.education_score == 90.0
-        assert score.skill_matches == '["Python", "JavaScript"]'
-        assert score.skill_gaps == '["Docker", "Kubernetes"]'
+        assert score.skill_matches == _SKILL_MATCHES
+        assert score.skill_gaps == _SKILL_GAPS
         assert score.recommendations == "Consider learning containerization technologies"
-        assert score.analysis_details == '{"confidence": 0.95}'
+        assert score.analysis_details == _ANALYSIS_DETAILS
         assert score.is_active is True
     
     def test_score_string_representations(self):
@@ -732,37 +774,22 @@ class TestScoreModelCreation:
         score.analysis_details = None
         assert score.get_analysis_details_dict() == {}
     
-    def test_score_grade_methods(self):
-        """Test score grade and level methods."""
-        # Test A+ grade
-        score = Score(
+    @pytest.fixture(scope="class")
+    def graded_score(self):
+        """Single score instance re-graded in place by each parametrized case."""
+        return Score(
             user_id=uuid.uuid4(),
             resume_id=1,
             analysis_type="overall",
-            overall_score=98.0
+            overall_score=0.0
         )
-        assert score.get_score_grade() == "A+"
-        assert score.get_score_level() == "Excellent"
-        
-        # Test A grade
-        score.overall_score = 95.0
-        assert score.get_score_grade() == "A"
-        assert score.get_score_level() == "Excellent"
-        
-        # Test B grade
-        score.overall_score = 85.0
-        assert score.get_score_grade() == "B"
-        assert score.get_score_level() == "Excellent"
-        
-        # Test C grade
-        score.overall_score = 75.0
-        assert score.get_score_grade() == "C"
-        assert score.get_score_level() == "Good"
-        
-        # Test F grade
-        score.overall_score = 30.0
-        assert score.get_score_grade() == "F"
-        assert score.get_score_level() == "Poor"
+    
+    @pytest.mark.parametrize("overall_score,grade,level", _SCORE_GRADES)
+    def test_score_grade_methods(self, graded_score, overall_score, grade, level):
+        """Test score grade and level methods."""
+        graded_score.overall_score = overall_score
+        assert graded_score.get_score_grade() == grade
+        assert graded_score.get_score_level() == level
     
     def test_score_recent_analysis_method(self):
         """Test score recent analysis method."""
@@ -783,10 +810,11 @@ class TestScoreModelCreation:
         score.analysis_date = None
         assert score.is_recent_analysis() is False
     
-    def test_score_to_dict(self):
+    def test_score_to_dict(self, make_model):
         """Test score to_dict method."""
         user_id = uuid.uuid4()
-        score = Score(
+        score = make_model(
+            Score,
             user_id=user_id,
             resume_id=1,
             analysis_type="job_match",
@@ -806,9 +834,64 @@ class TestScoreModelCreation:
         assert score_dict["skill_matches"] == ["Python", "JavaScript"]
         assert score_dict["skill_gaps"] == ["Docker"]
         # Note: is_active will be set by database defaults
-        assert "is_active" in score_dict
-        assert "id" in score_dict
-        assert "created_at" in score_dict
-        assert "grade" in score_dict
-        assert "level" in score_dict
-        assert "is_recent" in score_dict
+        assert {"is_active", "id", "created_at", "grade", "level", "is_recent"} <= score_dict.keys()
+
+
+class TestModelMetadata:
+    """Test model table names and mapped relationships."""
+    
+    def test_model_tablenames(self):
+        """Test that each model maps to the expected table."""
+        for model, tablename in _EXPECTED_TABLENAMES:
+            assert model.__tablename__ == tablename
+            assert model.__table__.name == tablename
+    
+    def test_model_relationships(self):
+        """Test that each model exposes the expected relationships."""
+        for model, expected in _EXPECTED_RELATIONSHIPS.items():
+            relationships = model.__mapper__.relationships.keys()
+            missing = expected.difference(relationships)
+            assert not missing, f"{model.__name__} is missing relationships: {sorted(missing)}"
+    
+    def test_model_columns_accept_sample_values(self):
+        """Test that sample constructor arguments map onto real table columns."""
+        dialect = sqlite.dialect()
+        for model, sample in _COLUMN_SAMPLES:
+            table = model.__table__
+            assert set(sample).issubset(table.c.keys()), model.__name__
+            # Bind each value the way the driver would, so a value the
+            # column type cannot convert fails here
+            for key, value in sample.items():
+                process = table.c[key].type.bind_processor(dialect)
+                if process is not None:
+                    process(value)
+    
+    def test_model_sql_generation(self):
+        """Test that CREATE TABLE DDL compiles for every mapped table."""
+        # A bare dialect is all the DDL compiler needs; no engine or pool
+        dialect = sqlite.dialect()
+        ddl_by_table = {
+            table.name: str(CreateTable(table).compile(dialect=dialect))
+            for table in Base.metadata.sorted_tables
+        }
+        
+        for _, tablename in _EXPECTED_TABLENAMES:
+            assert f"CREATE TABLE {tablename}" in ddl_by_table[tablename]
+    
+    @pytest.mark.slow
+    async def test_database_initialization(self):
+        """Test that the full schema can be created on an empty database."""
+        # A private engine, so the DDL really runs instead of finding the
+        # tables the session-scoped test engine already created
+        engine = create_async_engine("sqlite+aiosqlite://")
+        try:
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+                tablenames = await conn.run_sync(
+                    lambda sync_conn: set(inspect(sync_conn).get_table_names())
+                )
+        finally:
+            await engine.dispose()
+        
+        for _, tablename in _EXPECTED_TABLENAMES:
+            assert tablename in tablenames
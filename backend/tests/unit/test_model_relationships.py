@@ -14,7 +14,7 @@ from datetime import datetime
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload, selectinload
 
 from app.models.user import User
 from app.models.role import Role, UserRole
@@ -26,24 +26,20 @@ class TestUserRoleRelationships:
     """Test User-Role many-to-many relationships."""
     
     @pytest.mark.asyncio
-    async def test_user_role_creation_with_relationships(self):
+    async def test_user_role_creation_with_relationships(self, db):
         """Test creating user-role relationships."""
-        from app.db.database import get_async_session_local
-        
-        async with get_async_session_local()() as db:
-            # Create a user
-            user = User(
-                email="test@example.com",
-                hashed_password="hashed_password_123",
-                first_name="Test",
-                last_name="User",
-                is_active=True,
-                is_superuser=False,
-                is_verified=True
-            )
-            db.add(user)
-            await db.commit()
-            await db.refresh(user)
+        # Create a user
+        user = User(
+            email="test@example.com",
+            hashed_password="hashed_password_123",
+            first_name="Test",
+            last_name="User",
+            is_active=True,
+            is_superuser=False,
+            is_verified=True
+        )
+        db.add(user)
+        await db.commit()
         
         # Create a role
         role = Role(
@@ -54,7 +50,6 @@ class TestUserRoleRelationships:
         role.set_permissions_list(["read", "write"])
         db.add(role)
         await db.commit()
-        await db.refresh(role)
         
         # Create user-role relationship
         user_role = UserRole(
@@ -65,7 +60,6 @@ class TestUserRoleRelationships:
         )
         db.add(user_role)
         await db.commit()
-        await db.refresh(user_role)
         
         # Verify relationships
         assert user_role.user_id == user.id
@@ -74,7 +68,7 @@ class TestUserRoleRelationships:
         assert user_role.is_active is True
     
     @pytest.mark.asyncio
-    async def test_user_role_queries_with_relationships(self, db):
+    async def test_user_role_queries_with_relationships(self, db, count_queries):
         """Test querying users and roles with their relationships."""
         # Create users
         user1 = User(
@@ -97,8 +91,6 @@ class TestUserRoleRelationships:
         )
         db.add_all([user1, user2])
         await db.commit()
-        await db.refresh(user1)
-        await db.refresh(user2)
         
         # Create roles
         admin_role = Role(
@@ -117,8 +109,6 @@ class TestUserRoleRelationships:
         
         db.add_all([admin_role, user_role_model])
         await db.commit()
-        await db.refresh(admin_role)
-        await db.refresh(user_role_model)
         
         # Create user-role assignments
         user1_admin = UserRole(
@@ -135,29 +125,31 @@ class TestUserRoleRelationships:
         )
         db.add_all([user1_admin, user2_user])
         await db.commit()
-        await db.refresh(user1_admin)
-        await db.refresh(user2_user)
         
         # Query users with roles
-        result = await db.execute(
-            select(User)
-            .options(selectinload(User.roles).selectinload(UserRole.role))
-            .where(User.id == user1.id)
-        )
-        user_with_roles = result.scalar_one()
-        
-        assert len(user_with_roles.roles) == 1
-        assert user_with_roles.roles[0].role.name == "admin"
-        assert user_with_roles.roles[0].role.description == "Administrator role"
-        assert "read" in user_with_roles.roles[0].role.get_permissions_list()
-        assert "write" in user_with_roles.roles[0].role.get_permissions_list()
-        assert "delete" in user_with_roles.roles[0].role.get_permissions_list()
-        
-        # Test user role methods
-        assert user_with_roles.has_role("admin") is True
-        assert user_with_roles.has_role("user") is False
-        assert user_with_roles.is_admin() is True
-        assert "admin" in user_with_roles.get_role_names()
+        with count_queries(db) as statements:
+            result = await db.execute(
+                select(User)
+                .options(selectinload(User.roles).selectinload(UserRole.role))
+                .where(User.id == user1.id)
+            )
+            user_with_roles = result.scalar_one()
+            
+            assert len(user_with_roles.roles) == 1
+            assert user_with_roles.roles[0].role.name == "admin"
+            assert user_with_roles.roles[0].role.description == "Administrator role"
+            assert "read" in user_with_roles.roles[0].role.get_permissions_list()
+            assert "write" in user_with_roles.roles[0].role.get_permissions_list()
+            assert "delete" in user_with_roles.roles[0].role.get_permissions_list()
+            
+            # Test user role methods
+            assert user_with_roles.has_role("admin") is True
+            assert user_with_roles.has_role("user") is False
+            assert user_with_roles.is_admin() is True
+            assert "admin" in user_with_roles.get_role_names()
+        
+        # User, user_roles and (unless already in the identity map) roles
+        assert len(statements) <= 3
     
     @pytest.mark.asyncio
     async def test_user_role_cascade_deletion(self, db):
@@ -170,18 +162,14 @@ class TestUserRoleRelationships:
             is_superuser=False,
             is_verified=True
         )
-        db.add(user)
-        await db.commit()
-        await db.refresh(user)
-        
         role = Role(
             name="test_role",
             description="Test role",
             is_active=True
         )
-        db.add(role)
-        await db.commit()
-        await db.refresh(role)
+        # Flushing assigns both ids; the setup doesn't need its own commits
+        db.add_all([user, role])
+        await db.flush()
         
         # Create user-role relationship
         user_role = UserRole(
@@ -191,8 +179,7 @@ class TestUserRoleRelationships:
             is_active=True
         )
         db.add(user_role)
-        await db.commit()
-        await db.refresh(user_role)
+        await db.flush()
         
         # Verify relationship exists
         result = await db.execute(select(UserRole).where(UserRole.user_id == user.id))
@@ -232,7 +219,6 @@ class TestUserResumeRelationships:
         )
         db.add(user)
         await db.commit()
-        await db.refresh(user)
         
         # Create resume
         resume = Resume(
@@ -253,7 +239,6 @@ class TestUserResumeRelationships:
         
         db.add(resume)
         await db.commit()
-        await db.refresh(resume)
         
         # Verify relationship
         assert resume.user_id == user.id
@@ -268,7 +253,7 @@ class TestUserResumeRelationships:
         assert len(resume.get_languages_list()) == 2
     
     @pytest.mark.asyncio
-    async def test_user_multiple_resumes(self, db):
+    async def test_user_multiple_resumes(self, db, count_queries):
         """Test user having multiple resumes."""
         # Create user
         user = User(
@@ -282,7 +267,6 @@ class TestUserResumeRelationships:
         )
         db.add(user)
         await db.commit()
-        await db.refresh(user)
         
         # Create multiple resumes
         resume1 = Resume(
@@ -311,20 +295,20 @@ class TestUserResumeRelationships:
         
         db.add_all([resume1, resume2, resume3])
         await db.commit()
-        await db.refresh(resume1)
-        await db.refresh(resume2)
-        await db.refresh(resume3)
         
         # Query user with resumes
-        result = await db.execute(
-            select(User)
-            .options(selectinload(User.resumes))
-            .where(User.id == user.id)
-        )
-        user_with_resumes = result.scalar_one()
+        with count_queries(db) as statements:
+            result = await db.execute(
+                select(User)
+                .options(selectinload(User.resumes))
+                .where(User.id == user.id)
+            )
+            user_with_resumes = result.scalar_one()
+            
+            assert len(user_with_resumes.resumes) == 3
+            resume_titles = [resume.title for resume in user_with_resumes.resumes]
         
-        assert len(user_with_resumes.resumes) == 3
-        resume_titles = [resume.title for resume in user_with_resumes.resumes]
+        assert len(statements) == 2
         assert "Software Engineer Resume" in resume_titles
         assert "Data Scientist Resume" in resume_titles
         assert "Manager Resume" in resume_titles
@@ -341,8 +325,7 @@ class TestUserResumeRelationships:
             is_verified=True
         )
         db.add(user)
-        await db.commit()
-        await db.refresh(user)
+        await db.flush()
         
         # Create resumes
         resume1 = Resume(
@@ -357,9 +340,7 @@ class TestUserResumeRelationships:
         )
         
         db.add_all([resume1, resume2])
-        await db.commit()
-        await db.refresh(resume1)
-        await db.refresh(resume2)
+        await db.flush()
         
         # Verify resumes exist
         result = await db.execute(select(Resume).where(Resume.user_id == user.id))
@@ -394,7 +375,6 @@ class TestUserScoreRelationships:
         )
         db.add(user)
         await db.commit()
-        await db.refresh(user)
         
         # Create score
         score = Score(
@@ -412,7 +392,6 @@ class TestUserScoreRelationships:
         
         db.add(score)
         await db.commit()
-        await db.refresh(score)
         
         # Verify relationship
         assert score.user_id == user.id
@@ -441,7 +420,6 @@ class TestUserScoreRelationships:
         )
         db.add(user)
         await db.commit()
-        await db.refresh(user)
         
         # Create multiple scores
         score1 = Score(
@@ -469,9 +447,6 @@ class TestUserScoreRelationships:
         
         db.add_all([score1, score2, score3])
         await db.commit()
-        await db.refresh(score1)
-        await db.refresh(score2)
-        await db.refresh(score3)
         
         # Query user with scores
         result = await db.execute(
@@ -499,8 +474,7 @@ class TestUserScoreRelationships:
             is_verified=True
         )
         db.add(user)
-        await db.commit()
-        await db.refresh(user)
+        await db.flush()
         
         # Create scores
         score1 = Score(
@@ -517,9 +491,7 @@ class TestUserScoreRelationships:
         )
         
         db.add_all([score1, score2])
-        await db.commit()
-        await db.refresh(score1)
-        await db.refresh(score2)
+        await db.flush()
         
         # Verify scores exist
         result = await db.execute(select(Score).where(Score.user_id == user.id))
@@ -554,7 +526,6 @@ class TestResumeScoreRelationships:
         )
         db.add(user)
         await db.commit()
-        await db.refresh(user)
         
         # Create resume
         resume = Resume(
@@ -565,7 +536,6 @@ class TestResumeScoreRelationships:
         )
         db.add(resume)
         await db.commit()
-        await db.refresh(resume)
         
         # Create score for the resume
         score = Score(
@@ -578,7 +548,6 @@ class TestResumeScoreRelationships:
         )
         db.add(score)
         await db.commit()
-        await db.refresh(score)
         
         # Verify relationship
         assert score.user_id == user.id
@@ -601,7 +570,6 @@ class TestResumeScoreRelationships:
         )
         db.add(user)
         await db.commit()
-        await db.refresh(user)
         
         # Create resume
         resume = Resume(
@@ -611,7 +579,6 @@ class TestResumeScoreRelationships:
         )
         db.add(resume)
         await db.commit()
-        await db.refresh(resume)
         
         # Create multiple scores for the resume
         score1 = Score(
@@ -638,9 +605,6 @@ class TestResumeScoreRelationships:
         
         db.add_all([score1, score2, score3])
         await db.commit()
-        await db.refresh(score1)
-        await db.refresh(score2)
-        await db.refresh(score3)
         
         # Query resume with scores
         result = await db.execute(
@@ -670,8 +634,7 @@ class TestResumeScoreRelationships:
             is_verified=True
         )
         db.add(user)
-        await db.commit()
-        await db.refresh(user)
+        await db.flush()
         
         # Create resume
         resume = Resume(
@@ -680,8 +643,7 @@ class TestResumeScoreRelationships:
             file_name="resume.pdf"
         )
         db.add(resume)
-        await db.commit()
-        await db.refresh(resume)
+        await db.flush()
         
         # Create scores for the resume
         score1 = Score(
@@ -698,9 +660,7 @@ class TestResumeScoreRelationships:
         )
         
         db.add_all([score1, score2])
-        await db.commit()
-        await db.refresh(score1)
-        await db.refresh(score2)
+        await db.flush()
         
         # Verify scores exist
         result = await db.execute(select(Score).where(Score.resume_id == resume.id))
@@ -735,7 +695,6 @@ class TestComplexRelationships:
         )
         db.add(user)
         await db.commit()
-        await db.refresh(user)
         
         # Create role and assign to user
         role = Role(
@@ -746,7 +705,6 @@ class TestComplexRelationships:
         role.set_permissions_list(["read", "write"])
         db.add(role)
         await db.commit()
-        await db.refresh(role)
         
         user_role = UserRole(
             user_id=user.id,
@@ -756,7 +714,6 @@ class TestComplexRelationships:
         )
         db.add(user_role)
         await db.commit()
-        await db.refresh(user_role)
         
         # Create resume
         resume = Resume(
@@ -776,7 +733,6 @@ class TestComplexRelationships:
         ])
         db.add(resume)
         await db.commit()
-        await db.refresh(resume)
         
         # Create scores for the resume
         overall_score = Score(
@@ -806,18 +762,19 @@ class TestComplexRelationships:
         
         db.add_all([overall_score, job_match_score])
         await db.commit()
-        await db.refresh(overall_score)
-        await db.refresh(job_match_score)
         
-        # Query complete user with all relationships
+        # Query complete user with all relationships; raiseload turns any
+        # relationship left unloaded into an error instead of a lazy SELECT
         result = await db.execute(
             select(User)
             .options(
                 selectinload(User.roles).selectinload(UserRole.role),
                 selectinload(User.resumes),
-                selectinload(User.scores)
+                selectinload(User.scores),
+                raiseload("*")
             )
             .where(User.id == user.id)
+            .execution_options(populate_existing=True)
         )
         complete_user = result.scalar_one()
         
@@ -851,6 +808,11 @@ class TestComplexRelationships:
         assert "overall" in score_types
         assert "job_match" in score_types
         
+        # Serialization works from the eagerly loaded graph alone
+        user_dict = complete_user.to_dict()
+        assert user_dict["email"] == "complete@example.com"
+        assert "roles" in user_dict
+        
         # Verify resume-score relationship
         assert len(user_resume.scores) == 2
         resume_score_types = [score.analysis_type for score in user_resume.scores]